@@ -1,3 +1,22 @@
 """
 Rubik's Cube Simulator Package
-""" 
\ No newline at end of file
+"""
+
+import os
+
+def disable_gl_checks():
+    """
+    Turn off PyOpenGL's per-call error and array size checks, unless
+    RUBIK_GL_DEBUG=1 is set. PyOpenGL only reads these flags when
+    OpenGL.GL is first imported, so call this before anything imports it.
+    """
+    if os.environ.get("RUBIK_GL_DEBUG") == "1":
+        return
+    
+    try:
+        import OpenGL
+    except ImportError:
+        return  # Reported by the dependency checks
+    
+    OpenGL.ERROR_CHECKING = False
+    OpenGL.ARRAY_SIZE_CHECKING = False
@@ -2,10 +2,13 @@ import tkinter as tk
 import sys
 import os
 import logging
-from .controllers.app_controller import AppController
 
 def main():
     """Main entry point for the Rubik's Cube application."""
+    # Before anything imports OpenGL.GL
+    from . import disable_gl_checks
+    disable_gl_checks()
+    
     # Set up logging
     logging.basicConfig(level=logging.INFO, 
                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -35,7 +38,8 @@ def main():
     except Exception as e:
         logger.warning(f"Could not load application icon: {e}")
     
-    # Create the application controller
+    # Create the application controller (imports the model and views)
+    from .controllers.app_controller import AppController
     controller = AppController(use_fallback=use_fallback)
     
     # Create the UI through the controller
@@ -0,0 +1,44 @@
+"""
+Constants for the Rubik's Cube Simulator.
+Plain lookup tables shared by the model, views, and controllers.
+"""
+
+# Define colors using 3D coordinate system
+# Colors are defined by their position relative to the cube center
+WHITE = 0   # +Z (top)
+YELLOW = 1  # -Z (bottom)
+RED = 2     # +X (right)
+ORANGE = 3  # -X (left)
+BLUE = 4    # +Y (front)
+GREEN = 5   # -Y (back)
+
+# Color to RGB mapping, indexed by color
+COLOR_MAP = (
+    (1.0, 1.0, 1.0),  # White
+    (1.0, 1.0, 0.0),  # Yellow
+    (1.0, 0.0, 0.0),  # Red
+    (1.0, 0.5, 0.0),  # Orange
+    (0.0, 0.0, 1.0),  # Blue
+    (0.0, 1.0, 0.0),  # Green
+)
+
+# Face to axis mapping, indexed by face
+# Each face is defined by an axis and a direction (positive or negative)
+FACE_AXES = (
+    (2, 1),   # 0: +Z (top/white)
+    (2, -1),  # 1: -Z (bottom/yellow)
+    (0, 1),   # 2: +X (right/red)
+    (0, -1),  # 3: -X (left/orange)
+    (1, 1),   # 4: +Y (front/blue)
+    (1, -1),  # 5: -Y (back/green)
+)
+
+# Define which face is in which direction for easier lookup
+FACE_DIRECTIONS = {
+    "top": 0,     # +Z
+    "bottom": 1,  # -Z
+    "right": 2,   # +X
+    "left": 3,    # -X
+    "front": 4,   # +Y
+    "back": 5,    # -Y
+}
@@ -1,7 +1,10 @@
 import time
 import random
 import logging
-from ..models.cube_model import CubeModel, FACE_AXES
+from ..constants import FACE_AXES
+
+def _noop(*args):
+    """Stand-in for view hooks the current view does not provide."""
 
 class AppController:
     """
@@ -9,15 +12,18 @@ class AppController:
     """
     def __init__(self, use_fallback=False):
         """Initialize the controller."""
+        from ..models.cube_model import CubeModel
+        
         self.use_fallback = use_fallback
         self.cube_model = CubeModel()
         self.view = None  # Will be set when create_gui is called
         self.animation_speed = 0.5  # seconds per rotation
         
-        # Set up logging
-        logging.basicConfig(level=logging.INFO, 
-                           format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        # Logging is configured by the application entry point
         self.logger = logging.getLogger('RubiksCube')
+        
+        # No-op view hooks until create_gui picks a view
+        self._bind_view()
     
     def create_gui(self, root):
         """Create the appropriate GUI based on availability."""
@@ -36,8 +42,22 @@ class AppController:
                 self.view = create_fallback_gui(root)
                 self.logger.info("Falling back to 2D Tkinter GUI")
         
+        self._bind_view()
         return self.view
     
+    def _bind_view(self):
+        """Look up the optional hooks of the current view once."""
+        self._view_update = getattr(self.view, 'update', _noop)
+        self._view_set_speed = getattr(self.view, 'set_animation_speed', _noop)
+        self._view_cleanup = getattr(self.view, 'cleanup', _noop)
+        
+        self._view_set_model = getattr(self.view, 'set_cube_model', None)
+        if self._view_set_model is None:
+            if hasattr(self.view, 'cube_model'):
+                self._view_set_model = lambda model: setattr(self.view, 'cube_model', model)
+            else:
+                self._view_set_model = _noop
+    
     def rotate_face(self, face_idx, direction):
         """
         Rotate a face of the cube.
@@ -49,29 +69,24 @@ class AppController:
         if self.is_animating():
             return
         
-        # Convert face index to axis and sign
-        axis, sign = FACE_AXES[face_idx]
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Convert face index to axis and sign
+            axis, sign = FACE_AXES[face_idx]
+            self.logger.debug("Rotating face %d: axis=%d, sign=%d, direction=%d",
+                              face_idx, axis, sign, direction)
         
-        self.logger.info(f"Rotating face {face_idx}: axis={axis}, sign={sign}, direction={direction}")
         self.cube_model.rotate_face(face_idx, direction)
         
         # Update the view
-        if hasattr(self.view, 'update'):
-            self.view.update()
+        self._view_update()
     
     def reset_cube(self):
         """Reset the cube to solved state."""
         self.logger.info("Resetting cube to solved state")
-        self.cube_model = CubeModel()
+        self.cube_model.reset()
         
         # Update the view
-        if hasattr(self.view, 'set_cube_model'):
-            self.view.set_cube_model(self.cube_model)
-        elif hasattr(self.view, 'cube_model'):
-            self.view.cube_model = self.cube_model
-            
-        if hasattr(self.view, 'update'):
-            self.view.update()
+        self._view_update()
     
     def randomize_cube(self, num_moves=20):
         """
@@ -89,19 +104,13 @@ class AppController:
             self.cube_model.randomize(num_moves)
             
             # Update the view
-            if hasattr(self.view, 'update'):
-                self.view.update()
+            self._view_update()
         except Exception as e:
             self.logger.error(f"Error during randomization: {e}")
             self.cube_model = original_model
             
-            if hasattr(self.view, 'set_cube_model'):
-                self.view.set_cube_model(self.cube_model)
-            elif hasattr(self.view, 'cube_model'):
-                self.view.cube_model = self.cube_model
-                
-            if hasattr(self.view, 'update'):
-                self.view.update()
+            self._view_set_model(self.cube_model)
+            self._view_update()
     
     def solve_cube(self):
         """
@@ -126,11 +135,9 @@ class AppController:
         self.logger.info(f"Animation speed set to {self.animation_speed}")
         
         # Update renderer if available
-        if hasattr(self.view, 'set_animation_speed'):
-            self.view.set_animation_speed(self.animation_speed)
+        self._view_set_speed(self.animation_speed)
     
     def shutdown(self):
         """Clean up resources before shutting down."""
         self.logger.info("Shutting down application")
-        if hasattr(self.view, 'cleanup'):
-            self.view.cleanup() 
\ No newline at end of file
+        self._view_cleanup() 
\ No newline at end of file
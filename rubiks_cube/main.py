@@ -7,12 +7,37 @@ A 3D interactive Rubik's Cube simulation with Nintendo 64 style graphics.
 import tkinter as tk
 import sys
 import os
+from rubiks_cube import disable_gl_checks
+
+# Where the last working OpenGL backend is remembered between launches
+BACKEND_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "rubiks_cube", "backend")
+
+def _read_cached_backend():
+    """Return the cached OpenGL backend name, or None if there is none."""
+    try:
+        with open(BACKEND_CACHE_PATH) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def _write_cached_backend(backend):
+    """Remember a working OpenGL backend for the next launch."""
+    try:
+        os.makedirs(os.path.dirname(BACKEND_CACHE_PATH), exist_ok=True)
+        with open(BACKEND_CACHE_PATH, "w") as f:
+            f.write(backend)
+    except OSError as e:
+        print(f"Could not cache OpenGL backend: {e}")
 
 def check_dependencies():
     """Check if all required dependencies are available."""
     try:
-        # Try different OpenGL backends
+        # Try different OpenGL backends, starting with the one that worked last time
         backends = ['', 'egl', 'glx', 'osmesa', 'windows']
+        cached_backend = _read_cached_backend()
+        if cached_backend in backends:
+            backends.remove(cached_backend)
+            backends.insert(0, cached_backend)
         
         # Import required packages
         import numpy
@@ -30,6 +55,8 @@ def check_dependencies():
                 from OpenGL import GL
                 opengl_imported = True
                 print(f"OpenGL imported successfully with backend: {backend or 'default'}")
+                if backend != cached_backend:
+                    _write_cached_backend(backend)
                 break
             except ImportError:
                 print(f"Failed to import OpenGL with backend: {backend or 'default'}")
@@ -58,8 +85,12 @@ def check_dependencies():
 
 def main():
     """Main entry point for the application."""
-    # Check dependencies first
-    opengl_available = check_dependencies()
+    # Must run before check_dependencies first imports OpenGL.GL
+    disable_gl_checks()
+    
+    # Only probe the OpenGL stack when the 3D renderer may be used
+    use_fallback = '--fallback' in sys.argv
+    opengl_available = not use_fallback and check_dependencies()
     
     try:
         # Create the root window
@@ -90,7 +121,8 @@ def main():
                 app = create_fallback_gui(root)
         else:
             # Use the fallback renderer directly
-            print("OpenGL not available. Using 2D fallback renderer.")
+            if not use_fallback:
+                print("OpenGL not available. Using 2D fallback renderer.")
             from rubiks_cube.views.fallback_renderer import create_fallback_gui
             app = create_fallback_gui(root)
         
@@ -1,66 +1,288 @@
 import numpy as np
-from copy import deepcopy
+from ..constants import (
+    WHITE, YELLOW, RED, ORANGE, BLUE, GREEN,
+    COLOR_MAP, FACE_AXES, FACE_DIRECTIONS,
+)
 
-# Define colors using 3D coordinate system
-# Colors are defined by their position relative to the cube center
-WHITE = 0   # +Z (top)
-YELLOW = 1  # -Z (bottom)
-RED = 2     # +X (right)
-ORANGE = 3  # -X (left)
-BLUE = 4    # +Y (front)
-GREEN = 5   # -Y (back)
+# Numba is optional: without it face turns run as plain NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
-# Color to RGB mapping
-COLOR_MAP = {
-    WHITE: (1.0, 1.0, 1.0),   # White
-    YELLOW: (1.0, 1.0, 0.0),  # Yellow
-    RED: (1.0, 0.0, 0.0),     # Red
-    ORANGE: (1.0, 0.5, 0.0),  # Orange
-    BLUE: (0.0, 0.0, 1.0),    # Blue
-    GREEN: (0.0, 1.0, 0.0)    # Green
-}
+# Sticker slots on each cubie, named by the direction the sticker faces
+FACE_XP, FACE_XN, FACE_YP, FACE_YN, FACE_ZP, FACE_ZN = range(6)
+FACE_KEYS = ("x+", "x-", "y+", "y-", "z+", "z-")
 
-# Face to axis mapping
-# Each face is defined by an axis and a direction (positive or negative)
-FACE_AXES = {
-    0: (2, 1),    # +Z (top/white)
-    1: (2, -1),   # -Z (bottom/yellow)
-    2: (0, 1),    # +X (right/red)
-    3: (0, -1),   # -X (left/orange)
-    4: (1, 1),    # +Y (front/blue)
-    5: (1, -1),   # -Y (back/green)
-}
+# Marker for a cubie face without a sticker (hidden inside the cube)
+NO_COLOR = -1
+
+# Faces and directions that random moves are drawn from
+_RANDOM_FACES = (0, 1, 2, 3, 4, 5)
+_RANDOM_DIRS = (1, -1)  # 1 for clockwise, -1 for counterclockwise
+
+# Random number generator shared by all cubes
+_RNG = np.random.default_rng()
+
+# Every (face, direction) move, so one random index picks both
+_RANDOM_MOVES = np.array(
+    [(face, direction) for face in _RANDOM_FACES for direction in _RANDOM_DIRS],
+    dtype=np.int8,
+)
+
+def _sticker_index(axis, sign):
+    """Return the sticker slot facing along the given axis and sign."""
+    return 2 * axis + (0 if sign > 0 else 1)
+
+def _sticker_permutation(axis, direction):
+    """
+    Return the sticker relabelling for a quarter turn about an axis.
+    Entry i is the slot whose sticker ends up in slot i after the turn.
+    direction: 1 maps the first other axis onto the second, -1 the reverse
+    """
+    a1, a2 = [i for i in range(3) if i != axis]
+    perm = list(range(6))
+    for sign in (1, -1):
+        perm[_sticker_index(a2, sign * direction)] = _sticker_index(a1, sign)
+        perm[_sticker_index(a1, -sign * direction)] = _sticker_index(a2, sign)
+    return perm
+
+# Index of the 3x3 layer of cubies on each face, and of its sticker slot
+FACE_SLABS = []
+FACE_STICKERS = []
+for _axis, _sign in FACE_AXES:
+    _slab = [slice(None)] * 3
+    _slab[_axis] = _sign + 1
+    FACE_SLABS.append(tuple(_slab))
+    FACE_STICKERS.append(_sticker_index(_axis, _sign))
+FACE_SLABS = tuple(FACE_SLABS)
+FACE_STICKERS = tuple(FACE_STICKERS)
+
+# State of a solved cube, each face painted in the color sharing its index
+_SOLVED_STATE = np.full((3, 3, 3, 6), NO_COLOR, dtype=np.int8)
+for _face in range(len(FACE_AXES)):
+    _SOLVED_STATE[FACE_SLABS[_face] + (FACE_STICKERS[_face],)] = _face
+_SOLVED_STATE.flags.writeable = False
 
-# Define which face is in which direction for easier lookup
-FACE_DIRECTIONS = {
-    "top": 0,     # +Z
-    "bottom": 1,  # -Z
-    "right": 2,   # +X
-    "left": 3,    # -X
-    "front": 4,   # +Y
-    "back": 5,    # -Y
+# The 26 visible cubies in x, y, z order: their rows in the state viewed
+# as (27, 6), and their positions
+_CUBIE_ROWS = np.array([i for i in range(27) if i != 13], dtype=np.intp)
+_CUBIE_POSITIONS = (np.stack(np.unravel_index(_CUBIE_ROWS, (3, 3, 3)), axis=1) - 1).astype(np.float32)
+_CUBIE_POSITIONS.flags.writeable = False
+
+def _grid_position(axis, sign, pos):
+    """
+    Map a normalized (0-2) cubie position on a face to its (row, col)
+    in the 2D grid of that face, as seen from outside the cube.
+    """
+    # Extract coordinates for the other two axes
+    a1, a2 = [i for i in range(3) if i != axis]
+    c1, c2 = pos[a1], pos[a2]
+    
+    # The mapping depends on the face and sign
+    if axis == 0:  # X axis (left/right faces)
+        if sign > 0:  # Right face
+            return 2 - c2, c1  # Map (y, z) to (2-z, y)
+        else:  # Left face
+            return 2 - c2, 2 - c1  # Map (y, z) to (2-z, 2-y)
+    elif axis == 1:  # Y axis (front/back faces)
+        if sign > 0:  # Front face
+            return 2 - c2, 2 - c1  # Map (x, z) to (2-z, 2-x)
+        else:  # Back face
+            return 2 - c2, c1  # Map (x, z) to (2-z, x)
+    else:  # Z axis (top/bottom faces)
+        if sign > 0:  # Top face
+            return c2, c1  # Map (x, y) to (y, x)
+        else:  # Bottom face
+            return 2 - c2, c1  # Map (x, y) to (2-y, x)
+
+# Flat state index of the sticker shown in each cell of each face's 3x3 grid
+_FACE_GRID_INDICES = np.empty((6, 3, 3), dtype=np.intp)
+for _face, (_axis, _sign) in enumerate(FACE_AXES):
+    for _pos in np.ndindex(3, 3, 3):
+        if _pos[_axis] == _sign + 1:
+            _FACE_GRID_INDICES[(_face,) + _grid_position(_axis, _sign, _pos)] = (
+                np.ravel_multi_index(_pos + (FACE_STICKERS[_face],), (3, 3, 3, 6))
+            )
+
+# Sticker relabelling applied to the turning layer for each (face, direction)
+_STICKER_PERMS = {
+    (face, direction): _sticker_permutation(axis, direction * sign)
+    for face, (axis, sign) in enumerate(FACE_AXES)
+    for direction in (1, -1)
 }
 
+def _rotate_layer(state, face, direction):
+    """
+    Turn one face layer of a state array in place using NumPy.
+    Only used at import time to derive the turn tables below.
+    """
+    _, sign = FACE_AXES[face]
+    slab = FACE_SLABS[face]
+    
+    # Turn the layer of cubies, then turn each cubie's stickers with it
+    layer = np.rot90(state[slab], k=direction * sign)
+    state[slab] = layer[..., _STICKER_PERMS[face, direction]]
+
+# Flat state indices moved by each turn, indexed by [face, 0 for CW / 1 for CCW]:
+# the sticker at _TURN_SOURCES[..., i] ends up at _TURN_TARGETS[..., i]
+_TURN_TARGETS = np.empty((6, 2, 54), dtype=np.intp)
+_TURN_SOURCES = np.empty((6, 2, 54), dtype=np.intp)
+_labels = np.arange(3 * 3 * 3 * 6).reshape(3, 3, 3, 6)
+for _face in range(len(FACE_AXES)):
+    for _turn, _direction in enumerate((1, -1)):
+        _turned = _labels.copy()
+        _rotate_layer(_turned, _face, _direction)
+        _TURN_TARGETS[_face, _turn] = _labels[FACE_SLABS[_face]].ravel()
+        _TURN_SOURCES[_face, _turn] = _turned[FACE_SLABS[_face]].ravel()
+del _labels, _turned
+
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def _rotate_state(state, face, direction):
+        """Turn one face layer of a state array in place (compiled)."""
+        turn = 0 if direction == 1 else 1
+        targets = _TURN_TARGETS[face, turn]
+        sources = _TURN_SOURCES[face, turn]
+        
+        flat = state.reshape(state.size)
+        moved = np.empty(targets.shape[0], dtype=state.dtype)
+        for i in range(targets.shape[0]):
+            moved[i] = flat[sources[i]]
+        for i in range(targets.shape[0]):
+            flat[targets[i]] = moved[i]
+    
+    @njit(cache=True, boundscheck=False)
+    def _apply_moves(state, moves):
+        """Apply an (N, 2) array of (face, direction) moves in place (compiled)."""
+        for i in range(moves.shape[0]):
+            _rotate_state(state, moves[i, 0], moves[i, 1])
+else:
+    def _rotate_state(state, face, direction):
+        """Turn one face layer of a state array in place."""
+        turn = 0 if direction == 1 else 1
+        flat = state.reshape(-1)
+        flat[_TURN_TARGETS[face, turn]] = flat[_TURN_SOURCES[face, turn]]
+    
+    def _apply_moves(state, moves):
+        """Apply an (N, 2) array of (face, direction) moves in place."""
+        for face, direction in moves.tolist():
+            _rotate_state(state, face, direction)
+
+# Packed states hold the 54 visible stickers 3 bits each in one integer,
+# sticker i (in face-grid order) at bits 3i..3i+2
+_FACELETS = _FACE_GRID_INDICES.ravel()
+_PACKED_SOLVED = sum((i // 9) << (3 * i) for i in range(54))
+_PACKED_LOW_BITS = sum(1 << (3 * i) for i in range(54))
+
+# A quarter turn moves at most 20 stickers (8 on the face, 12 around it)
+_MAX_STICKERS_PER_TURN = 20
+
+# Deepest solution get_solution searches for before undoing the history
+_MAX_SEARCH_DEPTH = 5
+
+# Solutions get_solution found, as tuples keyed by packed state; once full,
+# the oldest entry makes room for the next
+_SOLUTION_CACHE = {}
+_SOLUTION_CACHE_SIZE = 128
+
+def _packed_turn_masks(face, turn):
+    """
+    Return (shift, mask) pairs applying one turn to a packed state:
+    the stickers selected by each mask all move by the same shift.
+    """
+    source_of = dict(zip(_TURN_TARGETS[face, turn].tolist(),
+                         _TURN_SOURCES[face, turn].tolist()))
+    facelet_of = {index: i for i, index in enumerate(_FACELETS.tolist())}
+    
+    masks = {}
+    for target, index in enumerate(_FACELETS.tolist()):
+        source = facelet_of[source_of.get(index, index)]
+        shift = 3 * (target - source)
+        masks[shift] = masks.get(shift, 0) | (0b111 << (3 * source))
+    return tuple(masks.items())
+
+# (shift, mask) pairs for each turn, indexed by [face][0 for CW / 1 for CCW]
+_PACKED_TURNS = tuple(
+    tuple(_packed_turn_masks(face, turn) for turn in (0, 1))
+    for face in range(len(FACE_AXES))
+)
+
+def pack_state(state):
+    """Pack the visible stickers of a state array into one integer."""
+    packed = 0
+    for color in reversed(state.ravel()[_FACELETS].tolist()):
+        packed = (packed << 3) | color
+    return packed
+
+def apply_packed(packed, face, direction):
+    """Return a packed state with one face turn applied."""
+    result = 0
+    for shift, mask in _PACKED_TURNS[face][0 if direction == 1 else 1]:
+        if shift >= 0:
+            result |= (packed & mask) << shift
+        else:
+            result |= (packed & mask) >> -shift
+    return result
+
+def _turns_to_solve(packed):
+    """Return a lower bound on the quarter turns needed to solve a packed state."""
+    diff = packed ^ _PACKED_SOLVED
+    misplaced = bin((diff | diff >> 1 | diff >> 2) & _PACKED_LOW_BITS).count("1")
+    return -(-misplaced // _MAX_STICKERS_PER_TURN)
+
+def _search_solution(packed, max_depth):
+    """
+    Find a shortest solution of at most max_depth moves for a packed
+    state using IDA*. Returns a list of (face, direction) or None.
+    """
+    path = []
+    
+    def search(state, depth_left):
+        if state == _PACKED_SOLVED:
+            return True
+        if _turns_to_solve(state) > depth_left:
+            return False
+        
+        last = path[-1] if path else None
+        for face in range(len(FACE_AXES)):
+            for direction in (1, -1):
+                # Skip undoing the last move, and spell half turns one way only
+                if last == (face, -direction) or last == (face, direction) == (face, -1):
+                    continue
+                
+                path.append((face, direction))
+                if search(apply_packed(state, face, direction), depth_left - 1):
+                    return True
+                path.pop()
+        return False
+    
+    for bound in range(_turns_to_solve(packed), max_depth + 1):
+        if search(packed, bound):
+            return path
+    return None
+
 class Cubie:
     """
     Represents a single cubie (small cube) in the Rubik's Cube.
     Each cubie has a position (x, y, z) and colors on visible faces.
     """
+    __slots__ = ('x', 'y', 'z', 'colors')
+    
     def __init__(self, x, y, z):
         """Initialize a cubie at the given position."""
         self.x = x  # -1, 0, or 1
         self.y = y  # -1, 0, or 1
         self.z = z  # -1, 0, or 1
         
-        # Initialize colors (None means not visible)
-        self.colors = {
-            "x+": RED if x == 1 else None,      # Right face
-            "x-": ORANGE if x == -1 else None,  # Left face
-            "y+": BLUE if y == 1 else None,     # Front face
-            "y-": GREEN if y == -1 else None,   # Back face
-            "z+": WHITE if z == 1 else None,    # Top face
-            "z-": YELLOW if z == -1 else None   # Bottom face
-        }
+        # Initialize colors by sticker slot (None means not visible)
+        self.colors = [None] * 6
+        self.colors[FACE_XP] = RED if x == 1 else None      # Right face
+        self.colors[FACE_XN] = ORANGE if x == -1 else None  # Left face
+        self.colors[FACE_YP] = BLUE if y == 1 else None     # Front face
+        self.colors[FACE_YN] = GREEN if y == -1 else None   # Back face
+        self.colors[FACE_ZP] = WHITE if z == 1 else None    # Top face
+        self.colors[FACE_ZN] = YELLOW if z == -1 else None  # Bottom face
     
     def __repr__(self):
         """String representation of the cubie."""
@@ -71,13 +293,26 @@ class CubeModel:
     Represents a Rubik's Cube using a 3D coordinate system.
     The cube is centered at the origin (0, 0, 0) with cubies at
     positions (x, y, z) where x, y, z ∈ {-1, 0, 1}.
+    
+    The state is a single int8 array of shape (3, 3, 3, 6) indexed by
+    (x+1, y+1, z+1, sticker slot), holding a color or NO_COLOR.
     """
     def __init__(self):
         """Initialize a solved 3x3x3 Rubik's Cube."""
-        # Create a 3x3x3 array to store the cubies
-        self.cubies = {}
+        self.state = _SOLVED_STATE.copy()
+        
+        # Animation properties
+        self.animating = False
+        self.animation_progress = 0
+        
+        # Keep track of move history
+        self.history = []
+        
+        # Set whenever the state changes; views clear it once they catch up
+        self.dirty = True
         
-        # Initialize all cubies
+        # Cubie objects mirroring the state, and the state they last mirrored
+        self._cubies = {}
         for x in range(-1, 2):
             for y in range(-1, 2):
                 for z in range(-1, 2):
@@ -85,54 +320,48 @@ class CubeModel:
                     if x == 0 and y == 0 and z == 0:
                         continue
                     
-                    # Create a cubie at this position
-                    self.cubies[(x, y, z)] = Cubie(x, y, z)
-        
-        # Animation properties
+                    self._cubies[(x, y, z)] = Cubie(x, y, z)
+        self._cubies_state = self.state.copy()
+    
+    @property
+    def cubies(self):
+        """
+        Return the cube as a {position: Cubie} dict.
+        The same Cubie objects are reused and updated in place when the
+        state has changed, so callers should treat them as read-only.
+        """
+        if not np.array_equal(self.state, self._cubies_state):
+            np.copyto(self._cubies_state, self.state)
+            for (x, y, z), cubie in self._cubies.items():
+                cubie.colors[:] = [
+                    None if color == NO_COLOR else color
+                    for color in self.state[x + 1, y + 1, z + 1].tolist()
+                ]
+        return self._cubies
+    
+    def reset(self):
+        """Return the cube to its solved state in place."""
+        np.copyto(self.state, _SOLVED_STATE)
+        self.history.clear()
         self.animating = False
         self.animation_progress = 0
-        
-        # Keep track of move history
-        self.history = []
+        self.dirty = True
     
     def get_state(self):
-        """Return the current state of the cube."""
-        return deepcopy(self.cubies)
+        """
+        Return the current state of the cube.
+        The result is a read-only view that tracks later moves; copy it
+        to keep a snapshot.
+        """
+        state = self.state.view()
+        state.flags.writeable = False
+        return state
     
     def is_solved(self):
         """Check if the cube is solved."""
-        # Check each face for uniform color
-        for face_idx, (axis, sign) in FACE_AXES.items():
-            # Get the color of the center cubie of this face
-            center_pos = [0, 0, 0]
-            center_pos[axis] = sign
-            center_color = None
-            
-            # Find which face of the center cubie is on this face
-            face_key = f"{['x', 'y', 'z'][axis]}{'+' if sign > 0 else '-'}"
-            
-            # Get all cubies on this face
-            cubies_on_face = []
-            for pos, cubie in self.cubies.items():
-                if pos[axis] == sign:
-                    cubies_on_face.append(cubie)
-                    
-                    # Get the center color if this is the center cubie
-                    is_center = True
-                    for i in range(3):
-                        if i != axis and pos[i] != 0:
-                            is_center = False
-                            break
-                    
-                    if is_center:
-                        center_color = cubie.colors[face_key]
-            
-            # Check if all cubies on this face have the same color on this face
-            for cubie in cubies_on_face:
-                if cubie.colors[face_key] != center_color:
-                    return False
-        
-        return True
+        # Gather all faces as a (6, 9) block and compare each to its center
+        stickers = self.state.ravel()[_FACE_GRID_INDICES.reshape(6, 9)]
+        return bool((stickers == stickers[:, 4:5]).all())
     
     def rotate_face(self, face, direction=1):
         """
@@ -143,157 +372,84 @@ class CubeModel:
         if self.animating:
             return False
         
-        print(f"Rotating face {face} in direction {direction}")
-        
         # Record the move
         self.history.append((face, direction))
         
-        # Get the axis and sign for this face
-        axis, sign = FACE_AXES[face]
-        
-        # Get all cubies on this face
-        face_cubies = {}
-        for pos, cubie in self.cubies.items():
-            if pos[axis] == sign:
-                face_cubies[pos] = cubie
-        
-        # Make a copy of the cubies to update
-        new_cubies = {}
-        
-        # Calculate new positions for cubies on this face
-        for pos, cubie in face_cubies.items():
-            # Determine the other two axes
-            other_axes = [i for i in range(3) if i != axis]
-            a1, a2 = other_axes
-            
-            # Calculate new position based on rotation
-            # For clockwise rotation around the positive axis:
-            # (x, y) -> (-y, x) for (a1, a2)
-            # For counterclockwise rotation or negative axis:
-            # Adjust rotation direction
-            effective_dir = direction * sign
-            
-            new_pos = list(pos)
-            if effective_dir == 1:  # Clockwise around the axis
-                new_pos[a1] = -pos[a2]
-                new_pos[a2] = pos[a1]
-            else:  # Counterclockwise around the axis
-                new_pos[a1] = pos[a2]
-                new_pos[a2] = -pos[a1]
-            
-            new_pos = tuple(new_pos)
-            
-            # Create a new cubie at the new position
-            new_cubie = Cubie(new_pos[0], new_pos[1], new_pos[2])
-            
-            # Update colors by rotating them
-            self._rotate_cubie_colors(cubie, new_cubie, axis, effective_dir)
-            
-            # Add to the new cubies dictionary
-            new_cubies[new_pos] = new_cubie
-        
-        # Update the cubies that weren't on the face
-        for pos, cubie in self.cubies.items():
-            if pos[axis] != sign:
-                new_cubies[pos] = cubie
-        
-        # Update the cubies dictionary
-        self.cubies = new_cubies
+        _rotate_state(self.state, face, direction)
+        self.dirty = True
         
         return True
     
-    def _rotate_cubie_colors(self, old_cubie, new_cubie, rotation_axis, direction):
+    def randomize(self, num_moves=20, seed=None):
         """
-        Update the colors of a cubie after rotation.
-        rotation_axis: 0=x, 1=y, 2=z
-        direction: 1=clockwise, -1=counterclockwise
+        Randomize the cube with a series of random moves.
+        seed: draw the moves from a generator seeded with this instead, so
+        the same seed always gives the same scramble
         """
-        # Map face keys to axis indices
-        face_to_axis = {
-            "x+": (0, 1),  # +X face -> +X axis
-            "x-": (0, -1), # -X face -> -X axis
-            "y+": (1, 1),  # +Y face -> +Y axis
-            "y-": (1, -1), # -Y face -> -Y axis
-            "z+": (2, 1),  # +Z face -> +Z axis
-            "z-": (2, -1)  # -Z face -> -Z axis
-        }
-        
-        # Reverse mapping for easier lookup
-        axis_to_face = {v: k for k, v in face_to_axis.items()}
-        
-        # Find which axes are affected by the rotation
-        affected_axes = [i for i in range(3) if i != rotation_axis]
-        
-        # Create a mapping of old faces to new faces
-        face_mapping = {}
-        
-        # Faces aligned with the rotation axis don't change
-        for face_key, (axis, sign) in face_to_axis.items():
-            if axis == rotation_axis:
-                face_mapping[face_key] = face_key
-        
-        # Determine the new orientation of the other faces
-        # This depends on the direction of rotation
-        affected_faces = [face for face, (axis, _) in face_to_axis.items() if axis in affected_axes]
-        
-        # Get the two affected axes
-        a1, a2 = affected_axes
+        if self.animating:
+            return False
         
-        # For each affected face
-        for face_key in affected_faces:
-            face_axis, face_sign = face_to_axis[face_key]
-            
-            # Calculate the new axis and sign after rotation
-            if face_axis == a1:
-                if direction == 1:  # Clockwise
-                    new_axis = a2
-                    new_sign = face_sign
-                else:  # Counterclockwise
-                    new_axis = a2
-                    new_sign = -face_sign
-            else:  # face_axis == a2
-                if direction == 1:  # Clockwise
-                    new_axis = a1
-                    new_sign = -face_sign
-                else:  # Counterclockwise
-                    new_axis = a1
-                    new_sign = face_sign
-            
-            # Map to the new face key
-            new_face_key = axis_to_face[(new_axis, new_sign)]
-            face_mapping[face_key] = new_face_key
+        rng = _RNG if seed is None else np.random.default_rng(seed)
         
-        # Apply the face mapping to update colors
-        for old_face, new_face in face_mapping.items():
-            if old_cubie.colors[old_face] is not None:
-                new_cubie.colors[new_face] = old_cubie.colors[old_face]
+        # Draw all the moves at once and apply them through the turn tables
+        moves = _RANDOM_MOVES[rng.integers(len(_RANDOM_MOVES), size=num_moves)]
+        return self.apply_moves(moves)
     
-    def randomize(self, num_moves=20):
-        """Randomize the cube with a series of random moves."""
+    def apply_moves(self, moves):
+        """
+        Apply a sequence of moves in one batch.
+        moves: (face, direction) pairs, or an (N, 2) integer array of them
+        """
         if self.animating:
             return False
-            
-        import random
-        faces = list(range(6))  # 0-5 for the six faces
-        directions = [1, -1]    # 1 for clockwise, -1 for counterclockwise
         
-        for _ in range(num_moves):
-            face = random.choice(faces)
-            direction = random.choice(directions)
-            self.rotate_face(face, direction)
+        moves = np.asarray(moves, dtype=np.int8).reshape(-1, 2)
+        
+        # Record the moves
+        self.history.extend(map(tuple, moves.tolist()))
+        
+        _apply_moves(self.state, moves)
+        self.dirty = True
         
         return True
     
+    def snapshot(self):
+        """
+        Return the cubies as arrays: float32 (26, 3) positions and int8
+        (26, 6) sticker colors in slot order, NO_COLOR where there is none.
+        The positions array is shared and read-only; the colors are a copy.
+        """
+        return _CUBIE_POSITIONS, self.state.reshape(27, 6)[_CUBIE_ROWS]
+    
+    def pack(self):
+        """Return the visible stickers packed 3 bits each into one integer."""
+        return pack_state(self.state)
+    
     def get_solution(self):
         """
         Find a solution to the current cube state.
-        This is a placeholder for a real solver algorithm.
+        Searches for a short solution with IDA* over packed states, and
+        otherwise returns the inverse of the move history.
         """
-        # In a real implementation, this would use an algorithm like Kociemba's
-        # For now, just return the inverse of the move history
+        # A solution found before for the same state still solves it
+        packed = self.pack()
+        cached = _SOLUTION_CACHE.get(packed)
+        if cached is not None:
+            return list(cached)
+        
+        # Undoing the history always works, so only search for something shorter
         solution = []
         for face, direction in reversed(self.history):
             solution.append((face, -direction))
+        
+        max_depth = min(len(solution) - 1, _MAX_SEARCH_DEPTH)
+        shorter = _search_solution(packed, max_depth)
+        if shorter is not None:
+            solution = shorter
+        
+        if len(_SOLUTION_CACHE) >= _SOLUTION_CACHE_SIZE:
+            del _SOLUTION_CACHE[next(iter(_SOLUTION_CACHE))]
+        _SOLUTION_CACHE[packed] = tuple(solution)
         return solution
     
     def get_face_colors(self, face):
@@ -301,61 +457,4 @@ class CubeModel:
         Get the colors of all cubies on a specific face.
         Returns a 3x3 grid of colors.
         """
-        axis, sign = FACE_AXES[face]
-        
-        # Create a 3x3 grid to store the colors
-        colors = np.zeros((3, 3), dtype=int)
-        
-        # Get the face key for this face
-        face_key = f"{['x', 'y', 'z'][axis]}{'+' if sign > 0 else '-'}"
-        
-        # Map from 3D coordinates to 2D grid coordinates
-        # The mapping depends on which face we're looking at
-        coord_map = self._get_coordinate_mapping(axis, sign)
-        
-        # Fill the grid with colors from the cubies
-        for pos, cubie in self.cubies.items():
-            if pos[axis] == sign:
-                # Normalize the coordinates (shift from -1,0,1 to 0,1,2)
-                normalized_pos = [p + 1 for p in pos]
-                
-                # Map 3D position to 2D grid using the appropriate mapping
-                row, col = coord_map(normalized_pos)
-                
-                # Set the color
-                colors[row, col] = cubie.colors[face_key]
-        
-        return colors
-    
-    def _get_coordinate_mapping(self, axis, sign):
-        """
-        Return a function that maps 3D coordinates to 2D grid coordinates.
-        The mapping depends on which face we're looking at.
-        """
-        # Get the other two axes
-        other_axes = [i for i in range(3) if i != axis]
-        a1, a2 = other_axes
-        
-        # Define the mapping function
-        def map_func(pos):
-            # Extract coordinates for the other two axes
-            c1, c2 = pos[a1], pos[a2]
-            
-            # The mapping depends on the face and sign
-            if axis == 0:  # X axis (left/right faces)
-                if sign > 0:  # Right face
-                    return 2 - c2, c1  # Map (y, z) to (2-z, y)
-                else:  # Left face
-                    return 2 - c2, 2 - c1  # Map (y, z) to (2-z, 2-y)
-            elif axis == 1:  # Y axis (front/back faces)
-                if sign > 0:  # Front face
-                    return 2 - c2, 2 - c1  # Map (x, z) to (2-z, 2-x)
-                else:  # Back face
-                    return 2 - c2, c1  # Map (x, z) to (2-z, x)
-            else:  # Z axis (top/bottom faces)
-                if sign > 0:  # Top face
-                    return c2, c1  # Map (x, y) to (y, x)
-                else:  # Bottom face
-                    return 2 - c2, c1  # Map (x, y) to (2-y, x)
-        
-        return map_func 
\ No newline at end of file
+        return self.state.ravel()[_FACE_GRID_INDICES[face]]
\ No newline at end of file
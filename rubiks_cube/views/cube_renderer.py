@@ -1,10 +1,126 @@
+import ctypes
 import numpy as np
 from OpenGL.GL import *
 from OpenGL.GLU import *
+from OpenGL import extensions
 import math
 import time
 from ..models.cube_model import COLOR_MAP, FACE_AXES
 
+# Numba is optional: without it the turning-layer mask is plain NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Outward normal of each cubie face, in sticker slot order (x+, x-, y+, y-, z+, z-)
+_FACE_NORMALS = (
+    (1, 0, 0),   # Right
+    (-1, 0, 0),  # Left
+    (0, 1, 0),   # Front
+    (0, -1, 0),  # Back
+    (0, 0, 1),   # Top
+    (0, 0, -1),  # Bottom
+)
+
+# Position of GL_LIGHT0 in eye space
+_LIGHT_POSITION = (5.0, 5.0, 5.0, 1.0)
+
+# Direction of the light used for the flat shading, normalized
+_LIGHT_X = _LIGHT_Y = _LIGHT_Z = 0.5 / math.sqrt(0.75)
+
+# Lambert term |normal . light| of each face; constant for axis-aligned normals
+_FACE_LAMBERT = np.array([
+    abs(nx * _LIGHT_X + ny * _LIGHT_Y + nz * _LIGHT_Z) for nx, ny, nz in _FACE_NORMALS
+])
+
+# COLOR_MAP as an array, indexed by (color, channel)
+_COLOR_RGB = np.array(COLOR_MAP)
+
+# Per face: (axis, sign, rotation axis vector, sign applied to the turn angle)
+# The Front and Back faces (indices 4 and 5) turn the other way on screen
+_ANIM_LUT = tuple(
+    (axis, sign, tuple(sign if i == axis else 0 for i in range(3)), -1 if face in (4, 5) else 1)
+    for face, (axis, sign) in enumerate(FACE_AXES)
+)
+
+# Corners of each face of the unit cube, in the same order as _FACE_NORMALS
+_FACE_QUADS = (
+    ((0.5, -0.5, -0.5), (0.5, -0.5, 0.5), (0.5, 0.5, 0.5), (0.5, 0.5, -0.5)),        # +X
+    ((-0.5, -0.5, -0.5), (-0.5, 0.5, -0.5), (-0.5, 0.5, 0.5), (-0.5, -0.5, 0.5)),    # -X
+    ((-0.5, 0.5, -0.5), (0.5, 0.5, -0.5), (0.5, 0.5, 0.5), (-0.5, 0.5, 0.5)),        # +Y
+    ((-0.5, -0.5, -0.5), (-0.5, -0.5, 0.5), (0.5, -0.5, 0.5), (0.5, -0.5, -0.5)),    # -Y
+    ((-0.5, -0.5, 0.5), (-0.5, 0.5, 0.5), (0.5, 0.5, 0.5), (0.5, -0.5, 0.5)),        # +Z
+    ((-0.5, -0.5, -0.5), (0.5, -0.5, -0.5), (0.5, 0.5, -0.5), (-0.5, 0.5, -0.5)),    # -Z
+)
+
+# The face tables as float32 arrays, indexed by face slot when building the sticker batch
+_QUAD_VERTS = np.ascontiguousarray(_FACE_QUADS, dtype=np.float32)
+_NORMAL_VECS = np.ascontiguousarray(_FACE_NORMALS, dtype=np.float32)
+
+# Endpoints of the 12 edges of the unit cube, in pairs
+_EDGE_VERTS = np.ascontiguousarray([
+    # Front face
+    [-0.5, -0.5, -0.5], [0.5, -0.5, -0.5],
+    [0.5, -0.5, -0.5], [0.5, 0.5, -0.5],
+    [0.5, 0.5, -0.5], [-0.5, 0.5, -0.5],
+    [-0.5, 0.5, -0.5], [-0.5, -0.5, -0.5],
+    
+    # Back face
+    [-0.5, -0.5, 0.5], [0.5, -0.5, 0.5],
+    [0.5, -0.5, 0.5], [0.5, 0.5, 0.5],
+    [0.5, 0.5, 0.5], [-0.5, 0.5, 0.5],
+    [-0.5, 0.5, 0.5], [-0.5, -0.5, 0.5],
+    
+    # Connecting lines
+    [-0.5, -0.5, -0.5], [-0.5, -0.5, 0.5],
+    [0.5, -0.5, -0.5], [0.5, -0.5, 0.5],
+    [0.5, 0.5, -0.5], [0.5, 0.5, 0.5],
+    [-0.5, 0.5, -0.5], [-0.5, 0.5, 0.5],
+], dtype=np.float32)
+
+# The 8 corners of the unit cube, and the edges as pairs of corner indices
+_CORNER_VERTS, _EDGE_INDICES = np.unique(_EDGE_VERTS, axis=0, return_inverse=True)
+_EDGE_INDICES = _EDGE_INDICES.astype(np.uint16).reshape(-1, 2)
+
+# Sticker slots of the two faces meeting at each edge: the ones on whose
+# plane both endpoints lie. Edges where neither face has a sticker are
+# inside the cube and never drawn.
+_EDGE_FACES = np.array([
+    [2 * axis + (0 if _CORNER_VERTS[a, axis] > 0 else 1)
+     for axis in range(3) if _CORNER_VERTS[a, axis] == _CORNER_VERTS[b, axis]]
+    for a, b in _EDGE_INDICES.tolist()
+])
+
+# Cubies are drawn at 95% size to leave gaps between them. glScalef used to
+# stretch the normals by the inverse scale; the sticker normals keep that lighting.
+_STICKER_CORNERS = _QUAD_VERTS * 0.95
+_STICKER_NORMALS = _NORMAL_VECS / 0.95
+_FRAME_CORNERS = _CORNER_VERTS * 0.95
+
+if njit is not None:
+    @njit(cache=True)
+    def _rotating_mask(positions, axis, sign):
+        """Return which cubie positions lie in the layer at axis == sign (compiled)."""
+        out = np.empty(positions.shape[0], np.bool_)
+        for i in range(positions.shape[0]):
+            out[i] = positions[i, axis] == sign
+        return out
+else:
+    def _rotating_mask(positions, axis, sign):
+        """Return which cubie positions lie in the layer at axis == sign."""
+        return positions[:, axis] == sign
+
+def _vertex_arrays_supported():
+    """Return whether the current context has vertex array objects (GL 3.0 or ARB_vertex_array_object)."""
+    version = glGetString(GL_VERSION) or b""
+    try:
+        major = int(version.split(b".", 1)[0])
+    except ValueError:
+        major = 0
+    return bool(glGenVertexArrays) and (
+        major >= 3 or extensions.hasGLExtension("GL_ARB_vertex_array_object"))
+
 class CubeRenderer:
     """
     Handles the 3D rendering of the Rubik's Cube using OpenGL.
@@ -24,6 +140,14 @@ class CubeRenderer:
         self.animation_duration = 0.5  # seconds per move
         self.current_animation = None
         
+        # Face being turned when the batched sticker buffer was last built
+        self._batch_face = None
+        self._vbo = None
+        self._vao = None  # 0 when the context has no vertex array objects
+        
+        # Set when the view changed and the next draw() must render
+        self._dirty = True
+        
         # Cube piece size
         self.cube_size = 1.0
         
@@ -31,6 +155,9 @@ class CubeRenderer:
         self.shading_intensity = 0.7  # Reduced shading for a flatter look
         self.edge_width = 2.0         # Width of the black outlines
         self.low_poly = True          # Enable low-poly style
+        
+        # Last GL state we set, so redundant calls can be skipped
+        self._gl_state = {'lighting': True, 'line_width': None}
     
     def init_gl(self, width, height):
         """Initialize OpenGL settings."""
@@ -47,11 +174,24 @@ class CubeRenderer:
             glEnable(GL_LIGHT0)
             glEnable(GL_COLOR_MATERIAL)
             
-            # Light position and properties
-            glLightfv(GL_LIGHT0, GL_POSITION, [5.0, 5.0, 5.0, 1.0])
+            # Light properties; the position is set by draw()
             glLightfv(GL_LIGHT0, GL_AMBIENT, [0.5, 0.5, 0.5, 1.0])
             glLightfv(GL_LIGHT0, GL_DIFFUSE, [0.8, 0.8, 0.8, 1.0])
             
+            # A fresh context starts with lighting on and nothing else cached
+            self._gl_state = {'lighting': True, 'line_width': None}
+            
+            # Compile or load the layer kernel now rather than on the first
+            # animated frame, after the turn's start time is already stamped.
+            # Numba specializes on read-only arrays, so warm it with the real one.
+            if njit is not None:
+                positions, _ = self.cube_model.snapshot()
+                _rotating_mask(positions, 0, 1)
+            
+            # Create the vertex buffers
+            self._init_geometry()
+            self._dirty = True
+            
             # Set up viewport
             self.resize_gl(width, height)
             return True
@@ -59,6 +199,110 @@ class CubeRenderer:
             print(f"OpenGL initialization error in renderer: {e}")
             return False
     
+    def _init_geometry(self):
+        """
+        Create the single VAO, VBO and element buffer everything is drawn
+        from, and leave them bound. Other code must not bind another VAO
+        or array buffer on this context.
+        """
+        # init_gl runs again on every resize; the buffers outlive it
+        if self._vbo is not None:
+            if self._vao:
+                glBindVertexArray(self._vao)
+            return
+        
+        float_size = np.dtype(np.float32).itemsize
+        
+        # Legacy contexts (such as macOS's GL 2.1) have no VAOs; there the
+        # bindings and pointers below are global state and stay set all the same
+        if _vertex_arrays_supported():
+            self._vao = glGenVertexArrays(1)
+            glBindVertexArray(self._vao)
+        else:
+            self._vao = 0
+        
+        # Stickers and frame corners of all cubies, pre-transformed, as
+        # (x, y, z, r, g, b, nx, ny, nz); frame edges index into them
+        self._vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self._vbo)
+        self._ebo = glGenBuffers(1)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self._ebo)
+        
+        stride = 9 * float_size
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, stride, ctypes.c_void_p(0))
+        glEnableClientState(GL_COLOR_ARRAY)
+        glColorPointer(3, GL_FLOAT, stride, ctypes.c_void_p(3 * float_size))
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glNormalPointer(GL_FLOAT, stride, ctypes.c_void_p(6 * float_size))
+        
+        # Force a rebuild on the first frame
+        self.cube_model.dirty = True
+    
+    def _rebuild_batched_vbo(self, face=None):
+        """
+        Upload the stickers and frames of every cubie into the batched VBO.
+        Those of the layer being turned by face go last, after
+        self._batch_split sticker vertices and self._frame_split edge
+        indices, so they can be drawn rotated.
+        """
+        positions, sticker_colors = self.cube_model.snapshot()
+        
+        if face is not None:
+            axis, sign = FACE_AXES[face]
+            rotating = _rotating_mask(positions, axis, sign)
+        else:
+            rotating = np.zeros(len(positions), dtype=np.bool_)
+        
+        # One row per sticker: which cubie it is on and which of its faces,
+        # stationary cubies first
+        cubie_index, face_index = np.nonzero(sticker_colors >= 0)
+        moving = rotating[cubie_index]
+        order = np.argsort(moving, kind='stable')
+        cubie_index, face_index = cubie_index[order], face_index[order]
+        self._batch_split = 4 * int(np.count_nonzero(~moving))
+        
+        # Translate and shrink the unit cube faces onto each cubie
+        corners = _STICKER_CORNERS[face_index]
+        corners += positions[cubie_index, None, :] * self.cube_size
+        
+        if self._shaded_colors is None:
+            self._update_shaded_colors()
+        colors = self._shaded_colors[face_index, sticker_colors[cubie_index, face_index]]
+        normals = _STICKER_NORMALS[face_index]
+        
+        data = np.concatenate([
+            corners,
+            np.broadcast_to(colors[:, None, :], corners.shape),
+            np.broadcast_to(normals[:, None, :], corners.shape),
+        ], axis=2).reshape(-1, 9)
+        self._batch_count = len(data)
+        
+        # Same for the frames: the corners of each cubie, stationary cubies first,
+        # stored after the stickers as black unlit vertices
+        frame_order = np.argsort(rotating, kind='stable')
+        frame_corners = _FRAME_CORNERS + positions[frame_order, None, :] * self.cube_size
+        frame_data = np.zeros((frame_corners.shape[0] * frame_corners.shape[1], 9), dtype=np.float32)
+        frame_data[:, :3] = frame_corners.reshape(-1, 3)
+        
+        # Edge index pairs into those corners, skipping edges inside the cube
+        visible = (sticker_colors[frame_order][:, _EDGE_FACES] >= 0).any(axis=2)
+        frame_indices = (
+            self._batch_count
+            + np.arange(len(frame_order), dtype=np.uint16)[:, None, None] * len(_CORNER_VERTS)
+            + _EDGE_INDICES
+        )[visible].ravel()
+        self._frame_count = len(frame_indices)
+        self._frame_split = 2 * int(np.count_nonzero(visible[~rotating[frame_order]]))
+        
+        # Both buffers stay bound from _init_geometry
+        data = np.concatenate([data, frame_data])
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_DYNAMIC_DRAW)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, frame_indices.nbytes, frame_indices, GL_DYNAMIC_DRAW)
+        
+        self.cube_model.dirty = False
+        self._batch_face = face
+    
     def resize_gl(self, width, height):
         """Handle window resize events."""
         if height == 0:
@@ -69,6 +313,21 @@ class CubeRenderer:
         glLoadIdentity()
         gluPerspective(45.0, float(width) / float(height), 0.1, 100.0)
         glMatrixMode(GL_MODELVIEW)
+        self._dirty = True
+    
+    @property
+    def animation_duration(self):
+        """Seconds per animated face turn."""
+        return self._animation_duration
+    
+    @animation_duration.setter
+    def animation_duration(self, seconds):
+        self._animation_duration = seconds
+        self._inv_anim_duration = 1.0 / seconds
+    
+    def _animation_progress(self):
+        """Return how far the current turn has got, from 0.0 to 1.0."""
+        return min((time.time() - self.animation_start_time) * self._inv_anim_duration, 1.0)
     
     def start_animation(self, face, direction):
         """Start an animation for rotating a face."""
@@ -76,6 +335,7 @@ class CubeRenderer:
             self.cube_model.animating = True
             self.animation_start_time = time.time()
             self.current_animation = (face, direction)
+            self._dirty = True
             return True
         return False
     
@@ -83,12 +343,9 @@ class CubeRenderer:
         """Update the current animation state."""
         if not self.cube_model.animating or self.current_animation is None:
             return False
-            
-        elapsed = time.time() - self.animation_start_time
-        progress = min(elapsed / self.animation_duration, 1.0)
         
         # If animation is complete
-        if progress >= 1.0:
+        if self._animation_progress() >= 1.0:
             face, direction = self.current_animation
             
             print(f"Animation complete for face {face}, direction {direction}")
@@ -96,6 +353,7 @@ class CubeRenderer:
             # Reset animation state first
             self.cube_model.animating = False
             self.current_animation = None
+            self._dirty = True
             
             # Now directly apply the rotation to the model
             self.cube_model.rotate_face(face, direction)
@@ -104,13 +362,34 @@ class CubeRenderer:
             
         return False
     
+    def invalidate(self):
+        """Make the next draw() render even if nothing seems to have changed."""
+        self._dirty = True
+    
+    def needs_redraw(self):
+        """Return whether the view, the cube or a running turn changed since the last frame."""
+        return self._dirty or self.cube_model.dirty or (
+            self.cube_model.animating and self.current_animation is not None)
+    
     def draw(self):
-        """Render the 3D cube."""
+        """
+        Render the 3D cube.
+        Returns False without touching the framebuffer when neither the
+        view nor the cube changed since the last frame.
+        """
+        if not self.needs_redraw():
+            return False
+        animating = self.cube_model.animating and self.current_animation is not None
+        
         try:
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
             
             glLoadIdentity()
             
+            # Place the light under the identity matrix so it stays fixed relative
+            # to the camera, as the precomputed sticker shading assumes
+            glLightfv(GL_LIGHT0, GL_POSITION, _LIGHT_POSITION)
+            
             # Position camera
             gluLookAt(
                 0, 0, self.distance,  # Eye position
@@ -122,189 +401,112 @@ class CubeRenderer:
             glRotatef(self.rotation_x, 1.0, 0.0, 0.0)
             glRotatef(self.rotation_y, 0.0, 1.0, 0.0)
             
-            # If there's an active animation, calculate intermediate state
-            if self.cube_model.animating and self.current_animation is not None:
+            # Rebuild the sticker batch after a move or when a turn starts or ends
+            if animating:
                 face, direction = self.current_animation
-                elapsed = time.time() - self.animation_start_time
-                progress = min(elapsed / self.animation_duration, 1.0)
-                
+            else:
+                face = None
+            if self.cube_model.dirty or face != self._batch_face:
+                self._rebuild_batched_vbo(face)
+            
+            # If there's an active animation, calculate intermediate state
+            if face is not None:
                 # Draw animated rotation
-                self._draw_animated_cube(face, direction, progress)
+                self._draw_animated_cube(face, direction, self._animation_progress())
             else:
                 # Draw normal cube
                 self._draw_cube()
+            
+            self._dirty = False
         except Exception as e:
             print(f"Error during OpenGL rendering: {e}")
+        return True
     
     def _draw_cube(self):
         """Draw the complete cube in its current state."""
-        # Get cubies state
-        cubies = self.cube_model.get_state()
+        # All stickers in one call
+        glDrawArrays(GL_QUADS, 0, self._batch_count)
         
-        # Draw each cubie
-        for pos, cubie in cubies.items():
-            self._draw_cubie(cubie)
+        # Draw black frames around the cubies, also in one call
+        if self.low_poly:
+            self._set_lighting(False)
+            self._set_line_width(self.edge_width)
+            
+            glDrawElements(GL_LINES, self._frame_count, GL_UNSIGNED_SHORT, None)
+            
+            self._set_lighting(True)
     
     def _draw_animated_cube(self, face, direction, progress):
         """Draw the cube during animation."""
-        # Get cubies state
-        cubies = self.cube_model.get_state()
-        
-        # Get the axis and sign for this face
-        axis, sign = FACE_AXES[face]
+        # Get the rotation axis vector for this face; its layer was split out
+        # by _rebuild_batched_vbo when the turn started
+        _, _, (x_axis, y_axis, z_axis), direction_sign = _ANIM_LUT[face]
         
         # Get the angle of rotation based on progress
-        # Reverse direction for Right and Left faces (indices 2 and 3)
-        if face in [4, 5]:  # Right or Left face
-            angle = 90.0 * progress * -direction  # Reverse the direction
-        else:
-            angle = 90.0 * progress * direction
+        angle = 90.0 * progress * direction * direction_sign
         
-        # Determine rotation axis vector
-        rotation_axis = [0, 0, 0]
-        rotation_axis[axis] = sign
+        # Stationary stickers, then the turning layer's stickers rotated
+        glDrawArrays(GL_QUADS, 0, self._batch_split)
         
-        # Draw cubies with appropriate transforms
-        for pos, cubie in cubies.items():
-            glPushMatrix()
-            
-            # If this cubie is on the rotating face, apply rotation
-            if pos[axis] == sign:
-                # Set up rotation around the appropriate axis
-                x_axis, y_axis, z_axis = rotation_axis
-                glRotatef(angle, x_axis, y_axis, z_axis)
-            
-            # Draw the cubie
-            self._draw_cubie(cubie)
-            
-            glPopMatrix()
-    
-    def _draw_cubie(self, cubie):
-        """Draw a single cubie."""
+        # One rotation covers the turning layer's stickers and frames
         glPushMatrix()
+        glRotatef(angle, x_axis, y_axis, z_axis)
+        glDrawArrays(GL_QUADS, self._batch_split, self._batch_count - self._batch_split)
         
-        # Position this cubie
-        glTranslatef(cubie.x * self.cube_size, cubie.y * self.cube_size, cubie.z * self.cube_size)
-        
-        # Scale slightly smaller to create separation between cubies
-        scale = 0.95
-        glScalef(scale, scale, scale)
-        
-        # Draw each colored face
-        face_normals = {
-            "x+": (1, 0, 0),   # Right
-            "x-": (-1, 0, 0),  # Left
-            "y+": (0, 1, 0),   # Front
-            "y-": (0, -1, 0),  # Back
-            "z+": (0, 0, 1),   # Top
-            "z-": (0, 0, -1)   # Bottom
-        }
-        
-        # Draw each face if it has a color
-        for face_key, color in cubie.colors.items():
-            if color is not None:
-                nx, ny, nz = face_normals[face_key]
-                self._draw_face(nx, ny, nz, color)
-        
-        # Draw black frame around the cubie
+        # Draw cubie frames the same way, turning layer first
         if self.low_poly:
-            glDisable(GL_LIGHTING)
-            glColor3f(0.0, 0.0, 0.0)
-            glLineWidth(self.edge_width)
-            
-            # Draw wireframe
-            glBegin(GL_LINES)
-            # Front face
-            glVertex3f(-0.5, -0.5, -0.5)
-            glVertex3f(0.5, -0.5, -0.5)
-            glVertex3f(0.5, -0.5, -0.5)
-            glVertex3f(0.5, 0.5, -0.5)
-            glVertex3f(0.5, 0.5, -0.5)
-            glVertex3f(-0.5, 0.5, -0.5)
-            glVertex3f(-0.5, 0.5, -0.5)
-            glVertex3f(-0.5, -0.5, -0.5)
-            
-            # Back face
-            glVertex3f(-0.5, -0.5, 0.5)
-            glVertex3f(0.5, -0.5, 0.5)
-            glVertex3f(0.5, -0.5, 0.5)
-            glVertex3f(0.5, 0.5, 0.5)
-            glVertex3f(0.5, 0.5, 0.5)
-            glVertex3f(-0.5, 0.5, 0.5)
-            glVertex3f(-0.5, 0.5, 0.5)
-            glVertex3f(-0.5, -0.5, 0.5)
-            
-            # Connecting lines
-            glVertex3f(-0.5, -0.5, -0.5)
-            glVertex3f(-0.5, -0.5, 0.5)
-            glVertex3f(0.5, -0.5, -0.5)
-            glVertex3f(0.5, -0.5, 0.5)
-            glVertex3f(0.5, 0.5, -0.5)
-            glVertex3f(0.5, 0.5, 0.5)
-            glVertex3f(-0.5, 0.5, -0.5)
-            glVertex3f(-0.5, 0.5, 0.5)
-            glEnd()
-            
-            glEnable(GL_LIGHTING)
+            self._set_lighting(False)
+            self._set_line_width(self.edge_width)
             
+            glDrawElements(GL_LINES, self._frame_count - self._frame_split, GL_UNSIGNED_SHORT,
+                           ctypes.c_void_p(2 * self._frame_split))
         glPopMatrix()
+        
+        if self.low_poly:
+            glDrawElements(GL_LINES, self._frame_split, GL_UNSIGNED_SHORT, None)
+            
+            self._set_lighting(True)
+    
+    def _set_lighting(self, enabled):
+        """Enable or disable GL_LIGHTING unless it is already in that state."""
+        if self._gl_state['lighting'] != enabled:
+            if enabled:
+                glEnable(GL_LIGHTING)
+            else:
+                glDisable(GL_LIGHTING)
+            self._gl_state['lighting'] = enabled
+    
+    def _set_line_width(self, width):
+        """Set the line width unless it is already set."""
+        if self._gl_state['line_width'] != width:
+            glLineWidth(width)
+            self._gl_state['line_width'] = width
     
-    def _draw_face(self, nx, ny, nz, color):
-        """Draw a single face with the specified normal and color."""
-        # Get RGB color from color index
-        r, g, b = COLOR_MAP[color]
+    @property
+    def shading_intensity(self):
+        """Share of a sticker's color kept on faces turned away from the light."""
+        return self._shading_intensity
+    
+    @shading_intensity.setter
+    def shading_intensity(self, value):
+        self._shading_intensity = value
         
+        # Recompute the shaded colors and the sticker batch on the next frame
+        self._shaded_colors = None
+        self.cube_model.dirty = True
+    
+    def _update_shaded_colors(self):
+        """
+        Precompute the flat-shaded RGB of every color on every cubie face,
+        as a float32 array indexed by (face index, color, channel).
+        """
         # Adjust for N64 style flat shading
-        shade = 1.0
+        shades = np.ones(len(_FACE_LAMBERT))
         if self.low_poly:
             # Simplified Lambert shading for N64 style
-            light_dir = np.array([0.5, 0.5, 0.5])
-            light_dir = light_dir / np.linalg.norm(light_dir)
-            normal = np.array([nx, ny, nz])
-            if np.linalg.norm(normal) > 0:
-                normal = normal / np.linalg.norm(normal)
-            dot = abs(np.dot(normal, light_dir))
-            shade = self.shading_intensity + (1.0 - self.shading_intensity) * dot
-        
-        glColor3f(r * shade, g * shade, b * shade)
-        
-        # Draw the face as a quad
-        glBegin(GL_QUADS)
-        glNormal3f(nx, ny, nz)
-        
-        # Determine which plane to draw on based on the normal
-        if nx == 1:    # Right face (+X)
-            glVertex3f(0.5, -0.5, -0.5)
-            glVertex3f(0.5, -0.5, 0.5)
-            glVertex3f(0.5, 0.5, 0.5)
-            glVertex3f(0.5, 0.5, -0.5)
-        elif nx == -1:  # Left face (-X)
-            glVertex3f(-0.5, -0.5, -0.5)
-            glVertex3f(-0.5, 0.5, -0.5)
-            glVertex3f(-0.5, 0.5, 0.5)
-            glVertex3f(-0.5, -0.5, 0.5)
-        elif ny == 1:   # Front face (+Y)
-            glVertex3f(-0.5, 0.5, -0.5)
-            glVertex3f(0.5, 0.5, -0.5)
-            glVertex3f(0.5, 0.5, 0.5)
-            glVertex3f(-0.5, 0.5, 0.5)
-        elif ny == -1:  # Back face (-Y)
-            glVertex3f(-0.5, -0.5, -0.5)
-            glVertex3f(-0.5, -0.5, 0.5)
-            glVertex3f(0.5, -0.5, 0.5)
-            glVertex3f(0.5, -0.5, -0.5)
-        elif nz == 1:   # Top face (+Z)
-            glVertex3f(-0.5, -0.5, 0.5)
-            glVertex3f(-0.5, 0.5, 0.5)
-            glVertex3f(0.5, 0.5, 0.5)
-            glVertex3f(0.5, -0.5, 0.5)
-        elif nz == -1:  # Bottom face (-Z)
-            glVertex3f(-0.5, -0.5, -0.5)
-            glVertex3f(0.5, -0.5, -0.5)
-            glVertex3f(0.5, 0.5, -0.5)
-            glVertex3f(-0.5, 0.5, -0.5)
-        
-        glEnd()
+            shades = self.shading_intensity + (1.0 - self.shading_intensity) * _FACE_LAMBERT
+        
+        self._shaded_colors = (shades[:, None, None] * _COLOR_RGB).astype(np.float32)
     
     def rotate_view(self, dx, dy):
         """Rotate the view based on mouse movement."""
@@ -313,7 +515,9 @@ class CubeRenderer:
         
         # Limit vertical rotation to avoid the cube flipping
         self.rotation_x = max(-90, min(90, self.rotation_x))
-        
+        self._dirty = True
+    
     def zoom(self, amount):
         """Adjust the camera distance based on scroll wheel."""
-        self.distance = max(5.0, min(25.0, self.distance - amount)) 
\ No newline at end of file
+        self.distance = max(5.0, min(25.0, self.distance - amount))
+        self._dirty = True
\ No newline at end of file
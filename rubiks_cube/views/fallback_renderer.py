@@ -1,6 +1,30 @@
 import tkinter as tk
 from ..models.cube_model import COLOR_MAP, FACE_AXES, FACE_DIRECTIONS
 
+# Top-left corner of each face in the unfolded cube, in cells from the canvas center
+# Arrangement:
+#     [0]
+# [3][4][2][5]
+#     [1]
+_FACE_OFFSETS = (
+    (-1.5, -4),    # Top - above center
+    (-1.5, 1),     # Bottom - below center
+    (1.5, -1.5),   # Right - right of center
+    (-4.5, -1.5),  # Left - left of center
+    (-1.5, -1.5),  # Front - center
+    (4.5, -1.5),   # Back - right of right face
+)
+
+# Face labels and their positions, in cells from the canvas center
+_LABELS = (
+    ("Top", 0, -5.5),
+    ("Bottom", 0, 4),
+    ("Right", 3, 0),
+    ("Left", -6, 0),
+    ("Front", 0, 0),
+    ("Back", 6, 0),
+)
+
 class FallbackGUI:
     """
     A fallback GUI implementation using only Tkinter.
@@ -17,6 +41,15 @@ class FallbackGUI:
         from ..models.cube_model import CubeModel
         self.cube_model = CubeModel()
         
+        # Hex code of each color, indexed by color
+        self._hex = ["#%02x%02x%02x" % (int(r*255), int(g*255), int(b*255)) for r, g, b in COLOR_MAP]
+        
+        # Canvas items, created on the first render and then updated in place
+        self._rects = None        # [face][row][col] rectangle ids
+        self._rect_colors = None  # [face][row][col] color each rectangle shows
+        self._labels = None       # label text ids, in face order
+        self._layout = None       # canvas size the items were placed for
+        
         # Create frames
         self.main_frame = tk.Frame(self.root, bg="#1e1e1e")
         self.main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -121,8 +154,7 @@ class FallbackGUI:
     
     def reset_cube(self):
         """Reset the cube to its solved state."""
-        from ..models.cube_model import CubeModel
-        self.cube_model = CubeModel()
+        self.cube_model.reset()
         self.render_cube()
     
     def randomize_cube(self):
@@ -147,13 +179,50 @@ class FallbackGUI:
         self.render_cube()
     
     def render_cube(self):
-        """Render the cube in 2D."""
-        self.canvas.delete("all")
-        
-        # Get canvas dimensions
-        width = self.canvas.winfo_width()
-        height = self.canvas.winfo_height()
+        """Render the cube in 2D, updating the existing canvas items."""
+        if self._rects is None:
+            self._create_items()
+        
+        # Lay the items out again only when the canvas size changed
+        layout = (self.canvas.winfo_width(), self.canvas.winfo_height())
+        if layout != self._layout:
+            self._layout = layout
+            self._place_items(*layout)
+        
+        # Recolor only the cells whose color changed
+        itemconfig = self.canvas.itemconfig
+        hex_colors = self._hex
+        for face in range(6):
+            face_colors = self.cube_model.get_face_colors(face).tolist()
+            rects = self._rects[face]
+            shown = self._rect_colors[face]
+            
+            for row in range(3):
+                for col in range(3):
+                    color_idx = face_colors[row][col]
+                    if shown[row][col] != color_idx:
+                        itemconfig(rects[row][col], fill=hex_colors[color_idx])
+                        shown[row][col] = color_idx
+    
+    def _create_items(self):
+        """Create the sticker rectangles and face labels once."""
+        create_rectangle = self.canvas.create_rectangle
+        
+        self._rects = [
+            [[create_rectangle(0, 0, 0, 0, outline="black", width=2) for col in range(3)]
+             for row in range(3)]
+            for face in range(6)
+        ]
+        self._rect_colors = [[[None] * 3 for row in range(3)] for face in range(6)]
         
+        # Add labels after the faces so they are drawn on top
+        self._labels = [
+            self.canvas.create_text(0, 0, text=label, fill="white", font=("Arial", 10))
+            for label, dx, dy in _LABELS
+        ]
+    
+    def _place_items(self, width, height):
+        """Move the canvas items to fit a canvas of the given size."""
         # Calculate cell size for the grid
         size = min(width, height) / 12
         
@@ -161,70 +230,24 @@ class FallbackGUI:
         center_x = width / 2
         center_y = height / 2
         
-        # Get colors for each face
-        face_colors = {}
-        for face in range(6):
-            face_colors[face] = self.cube_model.get_face_colors(face)
-        
         # Draw unfolded cube (like a cube net)
-        # Arrangement:
-        #     [0]
-        # [3][4][2][5]
-        #     [1]
-        
-        # Draw top face (index 0) - above center
-        self._draw_face(face_colors[0], center_x - 1.5 * size, center_y - 4 * size, size)
-        
-        # Draw bottom face (index 1) - below center
-        self._draw_face(face_colors[1], center_x - 1.5 * size, center_y + 1 * size, size)
-        
-        # Draw right face (index 2) - right of center
-        self._draw_face(face_colors[2], center_x + 1.5 * size, center_y - 1.5 * size, size)
-        
-        # Draw left face (index 3) - left of center
-        self._draw_face(face_colors[3], center_x - 4.5 * size, center_y - 1.5 * size, size)
-        
-        # Draw front face (index 4) - center
-        self._draw_face(face_colors[4], center_x - 1.5 * size, center_y - 1.5 * size, size)
-        
-        # Draw back face (index 5) - right of right face
-        self._draw_face(face_colors[5], center_x + 4.5 * size, center_y - 1.5 * size, size)
-        
-        # Add labels
-        labels = ["Top", "Bottom", "Right", "Left", "Front", "Back"]
-        positions = [
-            (center_x, center_y - 5.5 * size),  # Top
-            (center_x, center_y + 4 * size),    # Bottom
-            (center_x + 3 * size, center_y),    # Right
-            (center_x - 6 * size, center_y),    # Left
-            (center_x, center_y),               # Front
-            (center_x + 6 * size, center_y),    # Back
-        ]
+        for face, (dx, dy) in enumerate(_FACE_OFFSETS):
+            self._place_face(self._rects[face], center_x + dx * size, center_y + dy * size, size)
         
-        for label, pos in zip(labels, positions):
-            self.canvas.create_text(pos[0], pos[1], text=label, fill="white", font=("Arial", 10))
+        for text_id, (label, dx, dy) in zip(self._labels, _LABELS):
+            self.canvas.coords(text_id, center_x + dx * size, center_y + dy * size)
     
-    def _draw_face(self, face_colors, x, y, size):
-        """Draw a single face of the cube."""
+    def _place_face(self, rects, x, y, size):
+        """Move the cells of a single face of the cube."""
+        coords = self.canvas.coords
+        
         for row in range(3):
             for col in range(3):
-                # Get the color index at this position
-                color_idx = face_colors[row][col]
-                
-                # Convert color index to RGB hex code
-                r, g, b = COLOR_MAP[color_idx]
-                color = f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
-                
                 # Calculate position
                 cell_x = x + col * size
                 cell_y = y + row * size
                 
-                # Draw the cell
-                self.canvas.create_rectangle(
-                    cell_x, cell_y, 
-                    cell_x + size, cell_y + size,
-                    fill=color, outline="black", width=2
-                )
+                coords(rects[row][col], cell_x, cell_y, cell_x + size, cell_y + size)
 
 def create_fallback_gui(root):
     """Create and return a fallback GUI instance."""
@@ -1,9 +1,14 @@
 import tkinter as tk
 from tkinter import ttk
-import sys
-from OpenGL import GL
-from PIL import Image, ImageTk
-import numpy as np
+import collections
+import functools
+import time
+
+# PyOpenGL reads its error checking flags when OpenGL.GL is first imported,
+# here by pyopengltk if this module is the entry point
+from .. import disable_gl_checks
+disable_gl_checks()
+
 from pyopengltk import OpenGLFrame
 from ..models.cube_model import CubeModel
 from .cube_renderer import CubeRenderer
@@ -18,6 +23,17 @@ BUTTON_ACTIVE = "#444444"
 BORDER_COLOR = "#555555"
 FRAME_BG = "#222222"
 
+# Set once the ttk styles below are configured; the app uses a single Tk root
+_THEME_APPLIED = False
+
+# Bounds on the time between animation frames, in seconds; the loop
+# adapts between them to how long drawing a frame takes
+MIN_FRAME_INTERVAL = 1 / 120
+MAX_FRAME_INTERVAL = 1 / 30
+
+# Time between ticks of the animation loop while nothing needs drawing, in seconds
+IDLE_FRAME_INTERVAL = 0.05
+
 class RubiksCubeGUI:
     """Main GUI class for the Rubik's Cube application."""
     def __init__(self, root):
@@ -41,6 +57,14 @@ class RubiksCubeGUI:
         self.gl_frame = CubeGLFrame(self.main_frame, self.cube_model, width=600, height=500)
         self.gl_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
+        # Methods the animation loop calls every frame, looked up once
+        renderer = self.gl_frame.renderer
+        self._apply_pending_drag = self.gl_frame.apply_pending_drag
+        self._update_animation = renderer.update_animation
+        self._start_animation = renderer.start_animation
+        self._needs_redraw = renderer.needs_redraw
+        self._redraw = self.gl_frame.redraw
+        
         # Create control panel frame
         self.control_frame = ttk.Frame(self.main_frame, padding=10)
         self.control_frame.pack(fill=tk.X, expand=False, pady=(0, 10))
@@ -51,13 +75,32 @@ class RubiksCubeGUI:
         # Handle window close event
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
+        # Stop drawing while the window is minimized
+        self._visible = True
+        self.root.bind("<Map>", self._on_map)
+        self.root.bind("<Unmap>", self._on_unmap)
+        
+        # Solution moves still to be played back by the animation loop
+        self._pending_solution = collections.deque()
+        
+        # Pending root.after callbacks, cancelled when the window closes
+        self._after_ids = set()
+        
         # Start the animation loop
+        self._next_frame = time.perf_counter()
+        self._frame_time = 1 / 60  # moving average of the time to draw a frame
         self._animation_loop()
         
     def _apply_dark_theme(self):
         """Apply dark theme to all GUI elements."""
+        global _THEME_APPLIED
         self.root.configure(bg=DARK_BG)
         
+        # The style database is shared by every window, so set it up only once
+        if _THEME_APPLIED:
+            return
+        _THEME_APPLIED = True
+        
         # Create custom styles
         style = ttk.Style()
         style.theme_use('default')
@@ -87,29 +130,29 @@ class RubiksCubeGUI:
         self.face_frame = ttk.LabelFrame(self.control_frame, text="Face Controls", padding=10)
         self.face_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
-        # Define face rotation buttons with labels and commands
+        # Define face rotation buttons with labels, faces and directions
         # Using standard cube notation: U (top), D (bottom), F (front), B (back), L (left), R (right)
         # CW = clockwise, CCW = counter-clockwise
         face_buttons = [
-            ("Top CW", lambda: self._rotate_face(0, 1)),      # U - White face
-            ("Top CCW", lambda: self._rotate_face(0, -1)),    # U' - White face
-            ("Bottom CW", lambda: self._rotate_face(1, 1)),   # D - Yellow face 
-            ("Bottom CCW", lambda: self._rotate_face(1, -1)), # D' - Yellow face
-            ("Front CW", lambda: self._rotate_face(2, 1)),    # F - Red face
-            ("Front CCW", lambda: self._rotate_face(2, -1)),  # F' - Red face
-            ("Back CW", lambda: self._rotate_face(3, 1)),     # B - Orange face
-            ("Back CCW", lambda: self._rotate_face(3, -1)),   # B' - Orange face
-            ("Left CW", lambda: self._rotate_face(4, 1)),     # L - Blue face
-            ("Left CCW", lambda: self._rotate_face(4, -1)),   # L' - Blue face
-            ("Right CW", lambda: self._rotate_face(5, 1)),    # R - Green face
-            ("Right CCW", lambda: self._rotate_face(5, -1)),  # R' - Green face
+            ("Top CW", 0, 1),      # U - White face
+            ("Top CCW", 0, -1),    # U' - White face
+            ("Bottom CW", 1, 1),   # D - Yellow face 
+            ("Bottom CCW", 1, -1), # D' - Yellow face
+            ("Front CW", 2, 1),    # F - Red face
+            ("Front CCW", 2, -1),  # F' - Red face
+            ("Back CW", 3, 1),     # B - Orange face
+            ("Back CCW", 3, -1),   # B' - Orange face
+            ("Left CW", 4, 1),     # L - Blue face
+            ("Left CCW", 4, -1),   # L' - Blue face
+            ("Right CW", 5, 1),    # R - Green face
+            ("Right CCW", 5, -1),  # R' - Green face
         ]
         
         # Create a grid of buttons (4 rows x 3 columns)
-        for i, (text, command) in enumerate(face_buttons):
+        for i, (text, face, direction) in enumerate(face_buttons):
             row = i // 3
             col = i % 3
-            ttk.Button(self.face_frame, text=text, command=command).grid(
+            ttk.Button(self.face_frame, text=text, command=functools.partial(self._rotate_face, face, direction)).grid(
                 row=row, column=col, padx=5, pady=5, sticky="nsew"
             )
         
@@ -127,10 +170,10 @@ class RubiksCubeGUI:
         camera_frame = ttk.Frame(self.view_frame)
         camera_frame.pack(fill=tk.X, pady=(0, 10))
         
-        ttk.Button(camera_frame, text="↑", command=lambda: self._rotate_view(0, -10)).grid(row=0, column=1)
-        ttk.Button(camera_frame, text="←", command=lambda: self._rotate_view(-10, 0)).grid(row=1, column=0)
-        ttk.Button(camera_frame, text="→", command=lambda: self._rotate_view(10, 0)).grid(row=1, column=2)
-        ttk.Button(camera_frame, text="↓", command=lambda: self._rotate_view(0, 10)).grid(row=2, column=1)
+        ttk.Button(camera_frame, text="↑", command=functools.partial(self._rotate_view, 0, -10)).grid(row=0, column=1)
+        ttk.Button(camera_frame, text="←", command=functools.partial(self._rotate_view, -10, 0)).grid(row=1, column=0)
+        ttk.Button(camera_frame, text="→", command=functools.partial(self._rotate_view, 10, 0)).grid(row=1, column=2)
+        ttk.Button(camera_frame, text="↓", command=functools.partial(self._rotate_view, 0, 10)).grid(row=2, column=1)
         
         # Configure grid for camera buttons
         for i in range(3):
@@ -162,62 +205,102 @@ class RubiksCubeGUI:
         self.gl_frame.renderer.rotation_x = 30.0
         self.gl_frame.renderer.rotation_y = 45.0
         self.gl_frame.renderer.distance = 15.0
+        self.gl_frame.renderer.invalidate()
     
     def _reset_cube(self):
         """Reset the cube to its solved state."""
         if not self.cube_model.animating:
-            self.cube_model = CubeModel()
-            self.gl_frame.set_cube_model(self.cube_model)
+            self.cube_model.reset()
     
-    def _randomize_cube(self):
-        """Randomize the cube with random moves."""
+    def _randomize_cube(self, seed=None):
+        """Randomize the cube with random moves, optionally from a fixed seed."""
         if not self.cube_model.animating:
-            self.cube_model.randomize(20)
+            self.cube_model.randomize(20, seed=seed)
     
     def _solve_cube(self):
         """Solve the cube with an algorithm."""
-        if not self.cube_model.animating:
-            # Get solution moves
-            solution = self.cube_model.get_solution()
-            
-            # Start solving animation
-            self._animate_solution(solution)
-    
-    def _animate_solution(self, moves, index=0):
-        """Animate the solution moves one by one."""
-        if index >= len(moves) or self.cube_model.animating:
-            return
-            
-        # Get next move
-        face, direction = moves[index]
-        
-        # Start animation
-        self.gl_frame.renderer.start_animation(face, direction)
-        
-        # Schedule next move after current animation completes
-        self.root.after(int(self.gl_frame.renderer.animation_duration * 1000) + 100, 
-                       lambda: self._animate_solution(moves, index + 1))
+        if not self.cube_model.animating and not self._pending_solution:
+            # Queue the solution moves; the animation loop plays them back
+            self._pending_solution.extend(self.cube_model.get_solution())
     
     def _animation_loop(self):
         """Main animation loop to update the OpenGL display."""
+        # Nothing can be seen while minimized; check back less often
+        if not self._visible:
+            self._next_frame = time.perf_counter()
+            self._after(100, self._animation_loop)
+            return
+        
+        drawn = False
         try:
-            # Update animation state
-            self.gl_frame.renderer.update_animation()
+            # Apply the mouse drags since the last frame
+            self._apply_pending_drag()
+            
+            # Update animation state, if a turn is running
+            if self.cube_model.animating:
+                self._update_animation()
             
-            # Only redraw if the frame is visible and initialized
-            if hasattr(self.gl_frame, 'init_done') and self.gl_frame.init_done:
-                self.gl_frame.redraw()
+            # Start the next solution move as soon as the previous one finished
+            if self._pending_solution and not self.cube_model.animating:
+                self._start_animation(*self._pending_solution.popleft())
+            
+            # Only redraw if the frame is initialized and something changed
+            if self.gl_frame.init_done and self._needs_redraw():
+                start = time.perf_counter()
+                self._redraw()
+                self._frame_time = 0.9 * self._frame_time + 0.1 * (time.perf_counter() - start)
+                drawn = True
         except Exception as e:
             print(f"Animation loop error: {e}")
         
-        # Schedule the next update
-        self.root.after(16, self._animation_loop)  # ~60 FPS
+        # Leave a little more than the usual drawing time between frames, and
+        # poll less often while idle
+        if drawn:
+            interval = max(MIN_FRAME_INTERVAL, min(MAX_FRAME_INTERVAL, self._frame_time * 1.1))
+        else:
+            interval = IDLE_FRAME_INTERVAL
+        
+        # Schedule the next update against a fixed deadline, so the time spent
+        # drawing is absorbed into the interval instead of added to it
+        now = time.perf_counter()
+        self._next_frame += interval
+        if now - self._next_frame > 3 * interval:
+            # Too far behind to catch up; start counting from now
+            self._next_frame = now + interval
+        self._after(max(1, int((self._next_frame - now) * 1000)), self._animation_loop)
+    
+    def _after(self, ms, func):
+        """Schedule func like root.after, keeping its id until it runs."""
+        def callback():
+            self._after_ids.discard(after_id)
+            func()
+        
+        after_id = self.root.after(ms, callback)
+        self._after_ids.add(after_id)
+        return after_id
+    
+    def _on_map(self, event):
+        """Resume drawing once the window is shown again."""
+        # Child widgets' events reach the root's bindings too
+        if event.widget is self.root:
+            self._visible = True
+            self.gl_frame.renderer.invalidate()
+    
+    def _on_unmap(self, event):
+        """Pause drawing while the window is minimized."""
+        if event.widget is self.root:
+            self._visible = False
     
     def _on_close(self):
         """Handle window close event."""
-        self.root.quit()
+        # Cancel pending callbacks so none fires on destroyed widgets
+        for after_id in self._after_ids:
+            try:
+                self.root.after_cancel(after_id)
+            except tk.TclError:
+                pass
+        self._after_ids.clear()
         self.root.destroy()
-        sys.exit()
 
 
 class CubeGLFrame(OpenGLFrame):
@@ -231,6 +314,7 @@ class CubeGLFrame(OpenGLFrame):
         
         # Create renderer
         self.renderer = CubeRenderer(self.cube_model)
+        self._draw = self.renderer.draw
         
         # Track initialization state
         self.init_done = False
@@ -244,13 +328,18 @@ class CubeGLFrame(OpenGLFrame):
         
         self.last_x = 0
         self.last_y = 0
+        
+        # Drag movement not yet applied to the view; see apply_pending_drag
+        self._pending_dx = 0
+        self._pending_dy = 0
     
     def initgl(self):
         """Initialize OpenGL context."""
         try:
-            self.renderer.init_gl(self.width, self.height)
-            self.init_done = True
-            print("OpenGL initialized successfully")
+            # init_gl reports its own errors and returns False on failure
+            self.init_done = self.renderer.init_gl(self.width, self.height)
+            if self.init_done:
+                print("OpenGL initialized successfully")
         except Exception as e:
             print(f"OpenGL initialization error: {e}")
             self.init_done = False
@@ -262,11 +351,17 @@ class CubeGLFrame(OpenGLFrame):
             
         try:
             self.tkMakeCurrent()
-            self.renderer.draw()
-            self.tkSwapBuffers()
+            
+            # Only swap when the renderer actually drew a new frame
+            if self._draw():
+                self.tkSwapBuffers()
         except Exception as e:
             print(f"Redraw error: {e}")
     
+    def tkExpose(self, evt):
+        """Have the animation loop redraw the scene once the window is exposed."""
+        self.renderer.invalidate()
+    
     def set_cube_model(self, cube_model):
         """Update the cube model reference."""
         self.cube_model = cube_model
@@ -279,14 +374,20 @@ class CubeGLFrame(OpenGLFrame):
     
     def _on_mouse_drag(self, event):
         """Handle mouse drag for rotation."""
-        dx = event.x - self.last_x
-        dy = event.y - self.last_y
-        
-        self.renderer.rotate_view(dx, dy)
+        # Motion events can outpace the frame rate; apply them once per frame
+        self._pending_dx += event.x - self.last_x
+        self._pending_dy += event.y - self.last_y
         
         self.last_x = event.x
         self.last_y = event.y
     
+    def apply_pending_drag(self):
+        """Rotate the view by the mouse movement since the last call."""
+        if self._pending_dx or self._pending_dy:
+            self.renderer.rotate_view(self._pending_dx, self._pending_dy)
+            self._pending_dx = 0
+            self._pending_dy = 0
+    
     def _on_mouse_wheel(self, event, direction=None):
         """Handle mouse wheel for zoom."""
         if direction is None:
@@ -6,26 +6,15 @@ This is a convenience wrapper to run the application from the root directory.
 
 import sys
 import os
-import importlib
-import pkgutil
 
 def check_installation():
     """Check if required packages are installed."""
-    required_packages = [
-        "numpy", 
-        "OpenGL", 
-        "PIL", 
-        "pyopengltk"
-    ]
-    
-    missing = []
-    for package in required_packages:
-        if not pkgutil.find_loader(package):
-            missing.append(package)
-    
-    if missing:
-        print("Missing required packages:", ", ".join(missing))
-        print("Please install them with: pip install -r requirements.txt")
+    # The application imports these right away, so importing them here costs nothing extra
+    try:
+        import numpy, OpenGL, PIL, pyopengltk
+    except ImportError as e:
+        print("Missing required package:", e.name)
+        print("Please install it with: pip install -r requirements.txt")
         return False
     
     return True
@@ -52,8 +41,13 @@ def show_fallback_message():
 
 def main():
     """Main entry point with error handling."""
-    # Check if required packages are installed
-    if not check_installation():
+    # check_installation imports OpenGL.GL (through pyopengltk), so this goes first
+    from rubiks_cube import disable_gl_checks
+    disable_gl_checks()
+    
+    # Check if required packages are installed, unless asked to skip it
+    skip_check = os.environ.get("RUBIK_SKIP_CHECK") == "1" or "--fast" in sys.argv
+    if not skip_check and not check_installation():
         return 1
     
     try: